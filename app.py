@@ -1,6 +1,12 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, redirect
+from flask.json.provider import DefaultJSONProvider
 import base64
+import hashlib
 import io
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import quote
 import numpy as np
 from PIL import Image, ImageOps, ImageDraw, ImageFont
 from sklearn.cluster import KMeans
@@ -13,7 +19,43 @@ from datetime import datetime
 import tempfile
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+COMPACT_MIMETYPE = 'application/vnd.colorpicker.compact+json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+HARMONY_TYPES = ('monochromatic', 'analogous', 'complementary', 'triadic', 'tetradic', 'split_complementary')
+
+RESPONSE_CACHE_SIZE = 256
+CACHE_MAX_AGE = 24 * 60 * 60
+
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used when it is installed"""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 def rgb_to_hex(r, g, b):
     return '#{:02x}{:02x}{:02x}'.format(r, g, b)
@@ -283,6 +325,124 @@ def analyze_color_psychology(r, g, b):
     
     return psychology
 
+def compact_flag():
+    """Check whether the compact format was requested through the query string"""
+    return request.args.get('compact', '').lower() in ('1', 'true', 'yes')
+
+def wants_compact():
+    """Check whether the client asked for the compact palette format"""
+    if compact_flag():
+        return True
+    best = request.accept_mimetypes.best_match(
+        ['application/json', COMPACT_MIMETYPE, MSGPACK_MIMETYPE],
+        default='application/json'
+    )
+    return best != 'application/json'
+
+def wants_msgpack():
+    """Check whether the client accepts a MessagePack encoded response"""
+    if msgpack is None:
+        return False
+    best = request.accept_mimetypes.best_match(
+        ['application/json', COMPACT_MIMETYPE, MSGPACK_MIMETYPE],
+        default='application/json'
+    )
+    return best == MSGPACK_MIMETYPE
+
+def build_compact_palette(rgb_colors, **columns):
+    """Build a columnar palette: flat RGB triplets plus one list per extra field"""
+    palette = {
+        'format': 'compact',
+        'count': len(rgb_colors),
+        'rgb': [int(c) for rgb in rgb_colors for c in rgb],
+        'name': [get_color_name(r, g, b) for r, g, b in rgb_colors]
+    }
+    palette.update(columns)
+    return palette
+
+def compact_response(payload):
+    """Send a compact payload as MessagePack or JSON depending on the Accept header"""
+    if wants_msgpack():
+        return app.response_class(msgpack.packb(payload), mimetype=MSGPACK_MIMETYPE)
+    response = jsonify(payload)
+    response.mimetype = COMPACT_MIMETYPE
+    return response
+
+def normalize_hex(hex_color):
+    """Normalize a hex color to lowercase #rrggbb"""
+    value = str(hex_color).strip().lstrip('#').lower()
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    if not re.fullmatch(r'[0-9a-f]{6}', value):
+        raise ValueError(f'Invalid hex color: {hex_color}')
+    return f'#{value}'
+
+def request_params():
+    """Read route parameters from the query string on GET/HEAD, the JSON body otherwise"""
+    if request.method in ('GET', 'HEAD'):
+        return request.args
+    return request.get_json(silent=True) or {}
+
+def request_colors():
+    """Read the normalized palette from ?colors=a,b,c on GET/HEAD or the JSON body otherwise"""
+    if request.method in ('GET', 'HEAD'):
+        values = [v for item in request.args.getlist('colors') for v in item.split(',') if v]
+    else:
+        values = request_params().get('colors', [])
+    return tuple(normalize_hex(v) for v in values)
+
+def canonical_redirect(params):
+    """Redirect GET/HEAD requests whose query string is not canonical so caches share entries"""
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    query = '&'.join(
+        f"{name}={quote(str(value), safe=',' if name == 'colors' else '')}"
+        for name, value in params
+    )
+    if request.query_string.decode() == query:
+        return None
+    response = redirect(f'{request.path}?{query}', code=301)
+    response.cache_control.public = True
+    response.cache_control.max_age = CACHE_MAX_AGE
+    return response
+
+def canonical_colors(colors):
+    """Join normalized colors into the canonical ?colors= value"""
+    return ','.join(color.lstrip('#') for color in colors)
+
+def cached_response(key, build):
+    """Serve a deterministic response with a strong ETag, memoizing the encoded body"""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            _response_cache.move_to_end(key)
+    
+    if entry is None:
+        built = app.make_response(build())
+        if built.status_code != 200:
+            return built
+        body = built.get_data()
+        entry = (body, built.content_type, hashlib.sha256(body).hexdigest())
+        with _response_cache_lock:
+            _response_cache[key] = entry
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+    
+    body, content_type, etag = entry
+    response = app.response_class(body, content_type=content_type)
+    response.set_etag(etag)
+    if request.method in ('GET', 'HEAD'):
+        response.cache_control.public = True
+        response.cache_control.max_age = CACHE_MAX_AGE
+    return response.make_conditional(request)
+
+@app.after_request
+def add_vary_accept(response):
+    """Palette routes negotiate their format on Accept, so caches must key on it"""
+    if request.endpoint in ('upload', 'single_pixel', 'generate_harmony'):
+        response.vary.add('Accept')
+    return response
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -335,6 +495,21 @@ def upload():
         counts = np.bincount(labels)
         sorted_indices = np.argsort(-counts)
 
+        if wants_compact():
+            rgb_colors = [[int(x) for x in cluster_centers[i]] for i in sorted_indices]
+            return compact_response({
+                'colors': build_compact_palette(
+                    rgb_colors,
+                    percentage=[round((counts[i] / total_pixels) * 100, 1) for i in sorted_indices],
+                    pixel_count=[int(counts[i]) for i in sorted_indices]
+                ),
+                'image_info': {
+                    'width': width,
+                    'height': height,
+                    'total_pixels': total_pixels
+                }
+            })
+
         colors_data = []
         for idx, cluster_idx in enumerate(sorted_indices):
             r, g, b = [int(x) for x in cluster_centers[cluster_idx]]
@@ -408,6 +583,12 @@ def single_pixel():
         except IndexError:
             return jsonify({'error': 'Coordinates are outside image bounds.'}), 400
         
+        if wants_compact():
+            return compact_response({
+                'color': build_compact_palette([(r, g, b)]),
+                'coordinates': [x, y]
+            })
+        
         hex_color = rgb_to_hex(r, g, b)
         c, m, y, k = rgb_to_cmyk(r, g, b)
         h, s, l = rgb_to_hsl(r, g, b)
@@ -439,233 +620,310 @@ def single_pixel():
         app.logger.error(f"Error getting pixel color: {str(e)}")
         return jsonify({'error': f'Could not get pixel color: {str(e)}'}), 400
 
-@app.route('/generate-harmony', methods=['POST'])
+def build_harmony(base_rgb, harmony_type):
+    """Build the harmony response for a base color"""
+    harmony_colors = generate_color_harmony(base_rgb, harmony_type)
+    
+    if wants_compact():
+        return compact_response({
+            'harmony_type': harmony_type,
+            'colors': build_compact_palette(harmony_colors)
+        })
+    
+    colors_data = []
+    for idx, (r, g, b) in enumerate(harmony_colors):
+        hex_color = rgb_to_hex(r, g, b)
+        color_name = get_color_name(r, g, b)
+        c, m, y, k = rgb_to_cmyk(r, g, b)
+        h, s, l = rgb_to_hsl(r, g, b)
+        psychology = analyze_color_psychology(r, g, b)
+        
+        colors_data.append({
+            'hex': hex_color,
+            'rgb': f'rgb({r}, {g}, {b})',
+            'rgb_values': [r, g, b],
+            'cmyk': f'cmyk({c}%, {m}%, {y}%, {k}%)',
+            'hsl': f'hsl({h}, {s}%, {l}%)',
+            'name': color_name,
+            'psychology': psychology
+        })
+    
+    return jsonify({
+        'harmony_type': harmony_type,
+        'colors': colors_data
+    })
+
+@app.route('/generate-harmony', methods=['GET', 'POST'])
 def generate_harmony():
     """Generate color harmonies based on a base color"""
     try:
-        data = request.get_json()
-        if not data:
+        data = request_params()
+        if not data and request.method not in ('GET', 'HEAD'):
             return jsonify({'error': 'No JSON data received.'}), 400
         
-        hex_color = data.get('base_color', '#ff0000')
+        hex_color = normalize_hex(data.get('base_color', '#ff0000'))
         harmony_type = data.get('harmony_type', 'complementary')
+        if harmony_type not in HARMONY_TYPES:
+            harmony_type = 'complementary'
+        
+        canonical = canonical_redirect(
+            [('base_color', hex_color.lstrip('#')), ('harmony_type', harmony_type)]
+            + ([('compact', '1')] if compact_flag() else [])
+        )
+        if canonical:
+            return canonical
         
         # Convert hex to RGB
         base_rgb = hex_to_rgb(hex_color)
         
-        # Generate harmony
-        harmony_colors = generate_color_harmony(base_rgb, harmony_type)
-        
-        colors_data = []
-        for idx, (r, g, b) in enumerate(harmony_colors):
-            hex_color = rgb_to_hex(r, g, b)
-            color_name = get_color_name(r, g, b)
-            c, m, y, k = rgb_to_cmyk(r, g, b)
-            h, s, l = rgb_to_hsl(r, g, b)
-            psychology = analyze_color_psychology(r, g, b)
-            
-            colors_data.append({
-                'hex': hex_color,
-                'rgb': f'rgb({r}, {g}, {b})',
-                'rgb_values': [r, g, b],
-                'cmyk': f'cmyk({c}%, {m}%, {y}%, {k}%)',
-                'hsl': f'hsl({h}, {s}%, {l}%)',
-                'name': color_name,
-                'psychology': psychology
-            })
-        
-        return jsonify({
-            'harmony_type': harmony_type,
-            'colors': colors_data
-        })
+        return cached_response(
+            ('generate-harmony', hex_color, harmony_type, wants_compact(), wants_msgpack()),
+            lambda: build_harmony(base_rgb, harmony_type)
+        )
         
     except Exception as e:
         app.logger.error(f"Error generating harmony: {str(e)}")
         return jsonify({'error': f'Could not generate harmony: {str(e)}'}), 400
 
-@app.route('/accessibility-check', methods=['POST'])
+def build_accessibility_results(colors):
+    """Build the pairwise contrast report for a palette"""
+    results = []
+    for i, color1 in enumerate(colors):
+        for j, color2 in enumerate(colors):
+            if i != j:
+                rgb1 = hex_to_rgb(color1)
+                rgb2 = hex_to_rgb(color2)
+                
+                compliance = check_accessibility_compliance(rgb1, rgb2)
+                
+                results.append({
+                    'color1': color1,
+                    'color2': color2,
+                    'contrast_ratio': compliance['ratio'],
+                    'wcag_aa_normal': compliance['aa_normal'],
+                    'wcag_aa_large': compliance['aa_large'],
+                    'wcag_aaa_normal': compliance['aaa_normal'],
+                    'wcag_aaa_large': compliance['aaa_large']
+                })
+    
+    return jsonify({'accessibility_results': results})
+
+@app.route('/accessibility-check', methods=['GET', 'POST'])
 def accessibility_check():
     """Check accessibility compliance for color combinations"""
     try:
-        colors = request.json.get('colors', [])
+        colors = request_colors()
         
         if len(colors) < 2:
             return jsonify({'error': 'At least 2 colors required for accessibility check.'}), 400
         
-        results = []
-        for i, color1 in enumerate(colors):
-            for j, color2 in enumerate(colors):
-                if i != j:
-                    rgb1 = hex_to_rgb(color1)
-                    rgb2 = hex_to_rgb(color2)
-                    
-                    compliance = check_accessibility_compliance(rgb1, rgb2)
-                    
-                    results.append({
-                        'color1': color1,
-                        'color2': color2,
-                        'contrast_ratio': compliance['ratio'],
-                        'wcag_aa_normal': compliance['aa_normal'],
-                        'wcag_aa_large': compliance['aa_large'],
-                        'wcag_aaa_normal': compliance['aaa_normal'],
-                        'wcag_aaa_large': compliance['aaa_large']
-                    })
-        
-        return jsonify({'accessibility_results': results})
+        canonical = canonical_redirect([('colors', canonical_colors(colors))])
+        if canonical:
+            return canonical
+        
+        return cached_response(
+            ('accessibility-check', colors),
+            lambda: build_accessibility_results(colors)
+        )
         
     except Exception as e:
         app.logger.error(f"Error checking accessibility: {str(e)}")
         return jsonify({'error': f'Could not check accessibility: {str(e)}'}), 400
 
-@app.route('/color-blindness', methods=['POST'])
+def build_color_blindness_simulations(colors):
+    """Build the color blindness simulations for a palette"""
+    blindness_types = ['protanopia', 'deuteranopia', 'tritanopia', 'achromatopsia']
+    
+    results = {}
+    for blindness_type in blindness_types:
+        simulated_colors = []
+        for hex_color in colors:
+            rgb = hex_to_rgb(hex_color)
+            simulated_rgb = simulate_color_blindness(*rgb, blindness_type)
+            simulated_hex = rgb_to_hex(*simulated_rgb)
+            
+            simulated_colors.append({
+                'original': hex_color,
+                'simulated': simulated_hex,
+                'simulated_rgb': simulated_rgb
+            })
+        
+        results[blindness_type] = simulated_colors
+    
+    return jsonify({'simulations': results})
+
+@app.route('/color-blindness', methods=['GET', 'POST'])
 def color_blindness_simulation():
     """Simulate color blindness for a palette"""
     try:
-        colors = request.json.get('colors', [])
-        blindness_types = ['protanopia', 'deuteranopia', 'tritanopia', 'achromatopsia']
-        
-        results = {}
-        for blindness_type in blindness_types:
-            simulated_colors = []
-            for hex_color in colors:
-                rgb = hex_to_rgb(hex_color)
-                simulated_rgb = simulate_color_blindness(*rgb, blindness_type)
-                simulated_hex = rgb_to_hex(*simulated_rgb)
-                
-                simulated_colors.append({
-                    'original': hex_color,
-                    'simulated': simulated_hex,
-                    'simulated_rgb': simulated_rgb
-                })
-            
-            results[blindness_type] = simulated_colors
+        colors = request_colors()
+        
+        canonical = canonical_redirect([('colors', canonical_colors(colors))])
+        if canonical:
+            return canonical
         
-        return jsonify({'simulations': results})
+        return cached_response(
+            ('color-blindness', colors),
+            lambda: build_color_blindness_simulations(colors)
+        )
         
     except Exception as e:
         app.logger.error(f"Error simulating color blindness: {str(e)}")
         return jsonify({'error': f'Could not simulate color blindness: {str(e)}'}), 400
 
-@app.route('/generate-mockup', methods=['POST'])
+def build_mockup(colors, mockup_type):
+    """Render a mockup image for a palette"""
+    # Create a simple mockup image
+    width, height = 800, 600
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    
+    if mockup_type == 'website':
+        # Generate a website mockup
+        # Header
+        header_color = hex_to_rgb(colors[0])
+        draw.rectangle([0, 0, width, 80], fill=header_color)
+        
+        # Sidebar
+        if len(colors) > 1:
+            sidebar_color = hex_to_rgb(colors[1])
+            draw.rectangle([0, 80, 200, height], fill=sidebar_color)
+        
+        # Main content area
+        if len(colors) > 2:
+            content_color = hex_to_rgb(colors[2])
+            draw.rectangle([200, 80, width, height-60], fill=content_color)
+        
+        # Footer
+        if len(colors) > 3:
+            footer_color = hex_to_rgb(colors[3])
+            draw.rectangle([0, height-60, width, height], fill=footer_color)
+            
+    elif mockup_type == 'logo':
+        # Generate a logo mockup with color blocks
+        block_width = width // len(colors)
+        for i, color in enumerate(colors):
+            color_rgb = hex_to_rgb(color)
+            x1 = i * block_width
+            x2 = (i + 1) * block_width if i < len(colors) - 1 else width
+            draw.rectangle([x1, height//3, x2, 2*height//3], fill=color_rgb)
+    
+    # Save to temporary file
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
+    image.save(temp_file.name, 'PNG')
+    
+    # Convert to base64
+    with open(temp_file.name, 'rb') as f:
+        img_data = f.read()
+        img_base64 = base64.b64encode(img_data).decode()
+    
+    # Clean up
+    os.unlink(temp_file.name)
+    
+    return jsonify({
+        'mockup_image': f'data:image/png;base64,{img_base64}',
+        'mockup_type': mockup_type
+    })
+
+@app.route('/generate-mockup', methods=['GET', 'POST'])
 def generate_mockup():
     """Generate a visual mockup using the color palette"""
     try:
-        colors = request.json.get('colors', [])
-        mockup_type = request.json.get('mockup_type', 'website')
+        colors = request_colors()
+        mockup_type = request_params().get('mockup_type', 'website')
         
         if not colors:
             return jsonify({'error': 'No colors provided for mockup.'}), 400
         
-        # Create a simple mockup image
-        width, height = 800, 600
-        image = Image.new('RGB', (width, height), 'white')
-        draw = ImageDraw.Draw(image)
-        
-        if mockup_type == 'website':
-            # Generate a website mockup
-            # Header
-            header_color = hex_to_rgb(colors[0])
-            draw.rectangle([0, 0, width, 80], fill=header_color)
-            
-            # Sidebar
-            if len(colors) > 1:
-                sidebar_color = hex_to_rgb(colors[1])
-                draw.rectangle([0, 80, 200, height], fill=sidebar_color)
-            
-            # Main content area
-            if len(colors) > 2:
-                content_color = hex_to_rgb(colors[2])
-                draw.rectangle([200, 80, width, height-60], fill=content_color)
-            
-            # Footer
-            if len(colors) > 3:
-                footer_color = hex_to_rgb(colors[3])
-                draw.rectangle([0, height-60, width, height], fill=footer_color)
-                
-        elif mockup_type == 'logo':
-            # Generate a logo mockup with color blocks
-            block_width = width // len(colors)
-            for i, color in enumerate(colors):
-                color_rgb = hex_to_rgb(color)
-                x1 = i * block_width
-                x2 = (i + 1) * block_width if i < len(colors) - 1 else width
-                draw.rectangle([x1, height//3, x2, 2*height//3], fill=color_rgb)
-        
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-        image.save(temp_file.name, 'PNG')
-        
-        # Convert to base64
-        with open(temp_file.name, 'rb') as f:
-            img_data = f.read()
-            img_base64 = base64.b64encode(img_data).decode()
-        
-        # Clean up
-        os.unlink(temp_file.name)
+        canonical = canonical_redirect(
+            [('colors', canonical_colors(colors)), ('mockup_type', mockup_type)]
+        )
+        if canonical:
+            return canonical
         
-        return jsonify({
-            'mockup_image': f'data:image/png;base64,{img_base64}',
-            'mockup_type': mockup_type
-        })
+        return cached_response(
+            ('generate-mockup', colors, mockup_type),
+            lambda: build_mockup(colors, mockup_type)
+        )
         
     except Exception as e:
         app.logger.error(f"Error generating mockup: {str(e)}")
         return jsonify({'error': f'Could not generate mockup: {str(e)}'}), 400
 
-@app.route('/export-palette', methods=['POST'])
+def build_palette_export(colors, export_format, palette_name):
+    """Render a palette in the requested export format"""
+    if export_format == 'ase':
+        # Adobe Swatch Exchange format (simplified)
+        return jsonify({'error': 'ASE format not yet implemented.'}), 400
+        
+    elif export_format == 'css':
+        css_content = f"/* {palette_name} */\n:root {{\n"
+        for i, color in enumerate(colors):
+            css_content += f"  --color-{i+1}: {color};\n"
+        css_content += "}\n"
+        
+        return jsonify({
+            'content': css_content,
+            'filename': f'{palette_name.lower().replace(" ", "-")}.css',
+            'mime_type': 'text/css'
+        })
+        
+    elif export_format == 'scss':
+        scss_content = f"// {palette_name}\n"
+        for i, color in enumerate(colors):
+            scss_content += f"$color-{i+1}: {color};\n"
+        
+        return jsonify({
+            'content': scss_content,
+            'filename': f'{palette_name.lower().replace(" ", "-")}.scss',
+            'mime_type': 'text/scss'
+        })
+        
+    elif export_format == 'json':
+        json_content = {
+            'name': palette_name,
+            'colors': colors,
+            'created_at': datetime.now().isoformat(),
+            'total_colors': len(colors)
+        }
+        
+        return jsonify({
+            'content': json.dumps(json_content, indent=2),
+            'filename': f'{palette_name.lower().replace(" ", "-")}.json',
+            'mime_type': 'application/json'
+        })
+        
+    else:
+        return jsonify({'error': 'Unsupported export format.'}), 400
+
+@app.route('/export-palette', methods=['GET', 'POST'])
 def export_palette():
     """Export palette in various formats"""
     try:
-        colors = request.json.get('colors', [])
-        export_format = request.json.get('format', 'json')
-        palette_name = request.json.get('name', 'Custom Palette')
+        params = request_params()
+        colors = request_colors()
+        export_format = params.get('format', 'json')
+        palette_name = params.get('name', 'Custom Palette')
         
         if not colors:
             return jsonify({'error': 'No colors provided for export.'}), 400
         
-        if export_format == 'ase':
-            # Adobe Swatch Exchange format (simplified)
-            return jsonify({'error': 'ASE format not yet implemented.'}), 400
-            
-        elif export_format == 'css':
-            css_content = f"/* {palette_name} */\n:root {{\n"
-            for i, color in enumerate(colors):
-                css_content += f"  --color-{i+1}: {color};\n"
-            css_content += "}\n"
-            
-            return jsonify({
-                'content': css_content,
-                'filename': f'{palette_name.lower().replace(" ", "-")}.css',
-                'mime_type': 'text/css'
-            })
-            
-        elif export_format == 'scss':
-            scss_content = f"// {palette_name}\n"
-            for i, color in enumerate(colors):
-                scss_content += f"$color-{i+1}: {color};\n"
-            
-            return jsonify({
-                'content': scss_content,
-                'filename': f'{palette_name.lower().replace(" ", "-")}.scss',
-                'mime_type': 'text/scss'
-            })
-            
-        elif export_format == 'json':
-            json_content = {
-                'name': palette_name,
-                'colors': colors,
-                'created_at': datetime.now().isoformat(),
-                'total_colors': len(colors)
-            }
-            
-            return jsonify({
-                'content': json.dumps(json_content, indent=2),
-                'filename': f'{palette_name.lower().replace(" ", "-")}.json',
-                'mime_type': 'application/json'
-            })
-            
-        else:
-            return jsonify({'error': 'Unsupported export format.'}), 400
+        canonical = canonical_redirect(
+            [('colors', canonical_colors(colors)), ('format', export_format), ('name', palette_name)]
+        )
+        if canonical:
+            return canonical
+
+        if export_format == 'json':
+            # The JSON export is stamped with created_at, so it is never shared or memoized
+            response = app.make_response(build_palette_export(list(colors), export_format, palette_name))
+            response.cache_control.no_store = True
+            return response
+
+        return cached_response(
+            ('export-palette', colors, export_format, palette_name),
+            lambda: build_palette_export(list(colors), export_format, palette_name)
+        )
             
     except Exception as e:
         app.logger.error(f"Error exporting palette: {str(e)}")